@@ -1,27 +1,161 @@
 """Module for parsing go.mod files and checking module status."""
 
+import json
+import mmap
 import os
 import re
+import sqlite3
+import stat
+import sys
+import threading
+import time
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import Executor
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from packaging import version
 
+try:
+    # Optional: faster JSON decoding straight from bytes
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # Default timeout for HTTP requests in seconds
 DEFAULT_TIMEOUT = 10
 
-
-@dataclass
+# Minimum connection pool size per host; grown to cover the concurrent workers
+# so pooled keep-alive connections are reused instead of discarded
+POOL_MAXSIZE = 32
+
+# On-disk HTTP response cache shared between runs
+CACHE_PATH = os.path.join('~', '.cache', 'go-mod-checker', 'http_cache')
+CACHE_EXPIRE_AFTER = 3600  # seconds
+
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+# Repositories per GraphQL query; GitHub caps a query's node count
+GRAPHQL_BATCH_SIZE = 100
+
+# Cool-down applied to a rate-limited token whose reset time is missing or invalid
+DEFAULT_RATE_LIMIT_COOLDOWN = 60  # seconds
+
+
+# A require directive: `require ( ... )` block or single-line `require name version`.
+# Anchored at line start so commented-out directives are ignored. Bytes patterns,
+# as the parser scans the raw (usually memory-mapped) file.
+_REQUIRE_RE = re.compile(
+    rb'^[ \t]*require'
+    rb'(?:[ \t]*\((?P<block>.*?)^[ \t]*\)'
+    rb'|[ \t]+(?P<name>[^\s(]\S*)[ \t]+(?P<version>\S+)(?P<indirect>[ \t]+//[ \t]*indirect)?)',
+    re.MULTILINE | re.DOTALL,
+)
+# One `name version [// indirect]` line inside a require block; skips comment lines
+_REQUIRE_ENTRY_RE = re.compile(
+    rb'^[ \t]*([^\s/()]\S*)[ \t]+(\S+)([ \t]+//[ \t]*indirect)?',
+    re.MULTILINE,
+)
+
+# Page number of the `rel="last"` entry in a GitHub Link header
+_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Strict semantic version as used by Go modules: vX.Y.Z[-prerelease][+build]
+_VER_RE = re.compile(r'^v?(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$')
+
+# "Version" field of a Go proxy @latest response, e.g. {"Version":"v1.2.3","Time":"..."}
+_PROXY_VERSION_RE = re.compile(rb'"Version"\s*:\s*"([^"]+)"')
+
+
+def _semver_key(ver: str) -> Optional[tuple]:
+    """
+    Return a sort key for a strict semantic version, or None if it doesn't match.
+
+    Follows semver precedence: a release sorts after its prereleases, and
+    prerelease identifiers compare numerically when numeric, else lexically,
+    with numeric identifiers sorting first.
+    """
+    match = _VER_RE.match(ver)
+    if not match:
+        return None
+    major, minor, patch, pre = match.groups()
+    if pre is None:
+        return (int(major), int(minor), int(patch), 1, ())
+    pre_key = tuple((0, int(p), '') if p.isdigit() else (1, 0, p) for p in pre.split('.'))
+    return (int(major), int(minor), int(patch), 0, pre_key)
+
+
+def _rate_limit_reset(response: requests.Response) -> float:
+    """Return the epoch time from X-RateLimit-Reset, or a short cool-down if absent/invalid."""
+    try:
+        return float(response.headers['X-RateLimit-Reset'])
+    except (KeyError, ValueError):
+        return time.time() + DEFAULT_RATE_LIMIT_COOLDOWN
+
+
+def _graphql_not_found_aliases(payload: dict) -> set:
+    """Return the top-level aliases of a GraphQL payload that failed with NOT_FOUND."""
+    return {
+        error['path'][0]
+        for error in payload.get('errors') or []
+        if isinstance(error, dict) and error.get('type') == 'NOT_FOUND' and error.get('path')
+    }
+
+
+def _is_cacheable_response(response: requests.Response) -> bool:
+    """
+    requests-cache filter that keeps failed GraphQL answers out of the cache.
+
+    GraphQL reports errors with HTTP 200, so a response without data, or with
+    any error other than NOT_FOUND (e.g. RATE_LIMITED), must not be replayed
+    on later runs. Non-POST responses are always cacheable.
+    """
+    if response.request is None or response.request.method != 'POST':
+        return True
+    try:
+        payload = _json_loads(response.content)
+    except ValueError:
+        return False
+    if not isinstance(payload, dict) or not payload.get('data'):
+        return False
+    return all(
+        isinstance(error, dict) and error.get('type') == 'NOT_FOUND'
+        for error in payload.get('errors') or []
+    )
+
+
+def _github_repo(module_name: str) -> Optional[Tuple[str, str]]:
+    """Return (owner, repo) for a GitHub-hosted module path, else None."""
+    # Go module paths on GitHub always have the format: github.com/owner/repo[/subpath]
+    parts = module_name.split('/')
+    if len(parts) >= 3 and parts[0] == 'github.com':
+        return parts[1], parts[2]
+    return None
+
+
+# Slotted dataclasses drop the per-instance __dict__; only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Module:
     """Represents a Go module dependency."""
     name: str
     version: str
     is_indirect: bool = False
+    # Semver sort key of version, parsed once (None if not strict semver)
+    version_key: Optional[tuple] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self.version_key = _semver_key(self.version)
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ModuleCheckResult:
     """Result of checking a module's status."""
     status: str  # 'ARCHIVED', 'OUTDATED', 'OK'
@@ -31,6 +165,42 @@ class ModuleCheckResult:
     warnings: List[str] = field(default_factory=list)
 
 
+class _TokenPool:
+    """Round-robin pool of GitHub tokens that skips rate-limited ones."""
+
+    def __init__(self, tokens: List[str]):
+        self._tokens = deque(tokens)
+        self._cooling_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def next(self) -> Tuple[Optional[str], bool]:
+        """
+        Return the next token that is not rate-limited, and whether it is cooling down.
+
+        If every token is cooling down, the next one in rotation is returned
+        anyway so the request still carries authentication; the flag is then
+        True. An empty pool yields (None, False).
+        """
+        with self._lock:
+            if not self._tokens:
+                return None, False
+            now = time.time()
+            for _ in range(len(self._tokens)):
+                token = self._tokens[0]
+                self._tokens.rotate(-1)
+                if self._cooling_until.get(token, 0) <= now:
+                    return token, False
+            return token, True
+
+    def cool_down(self, token: str, until: float) -> None:
+        """Skip a token until the given epoch time (its rate limit reset)."""
+        with self._lock:
+            self._cooling_until[token] = until
+
+
 class GoModParser:
     """Parser for go.mod files."""
 
@@ -40,50 +210,44 @@ class GoModParser:
 
     def parse(self) -> List[Module]:
         """Parse the go.mod file and return list of direct dependencies."""
-        modules = []
-
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            f = open(self.filepath, 'rb')
         except FileNotFoundError:
             raise FileNotFoundError(f"go.mod file not found at {self.filepath}")
 
-        # Parse require block
-        in_require = False
-        for line in content.split('\n'):
-            line = line.strip()
+        with f:
+            st = os.fstat(f.fileno())
+            if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+                # Scan the mapped file directly; only matched names and versions
+                # are decoded, instead of the whole file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    modules = self._parse_content(content)
+            else:
+                # Empty files can't be mapped, and pipes/FIFOs (e.g. <(cat go.mod))
+                # report a size of 0 but still have content to read
+                modules = self._parse_content(f.read())
 
-            # Skip comments
-            if line.startswith('//'):
-                continue
+        return modules
 
-            # Check for require block
-            if line.startswith('require ('):
-                in_require = True
-                continue
-            elif line == ')' and in_require:
-                in_require = False
-                continue
+    @staticmethod
+    def _parse_content(content) -> List[Module]:
+        """Extract direct dependencies from go.mod content (bytes or an mmap)."""
+        modules = []
 
-            # Parse single require statement
-            if line.startswith('require '):
-                match = re.match(r'require\s+(\S+)\s+(\S+)(\s+//\s*indirect)?', line)
-                if match:
-                    name = match.group(1)
-                    version = match.group(2)
-                    is_indirect = match.group(3) is not None
-                    if not is_indirect:  # Only add direct dependencies
-                        modules.append(Module(name, version, is_indirect))
-
-            # Parse require block lines
-            elif in_require:
-                match = re.match(r'(\S+)\s+(\S+)(\s+//\s*indirect)?', line)
-                if match:
-                    name = match.group(1)
-                    version = match.group(2)
-                    is_indirect = match.group(3) is not None
-                    if not is_indirect:  # Only add direct dependencies
-                        modules.append(Module(name, version, is_indirect))
+        # Scan require directives in file order: either a `require ( ... )`
+        # block or a single-line `require name version`
+        for match in _REQUIRE_RE.finditer(content):
+            block = match.group('block')
+            if block is None:
+                entries = [match.group('name', 'version', 'indirect')]
+            else:
+                entries = _REQUIRE_ENTRY_RE.findall(block)
+
+            modules.extend(
+                Module(name.decode('utf-8'), version.decode('utf-8'))
+                for name, version, indirect in entries
+                if not indirect  # Only add direct dependencies
+            )
 
         return modules
 
@@ -91,42 +255,234 @@ class GoModParser:
 class ModuleChecker:
     """Checker for Go module status."""
 
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(self, timeout: int = DEFAULT_TIMEOUT, use_cache: bool = True, max_workers: int = 1):
         """
         Initialize the module checker.
 
         Args:
             timeout: Timeout in seconds for HTTP requests (default: 10)
+            use_cache: Cache HTTP responses on disk between runs (default: True)
+            max_workers: Number of threads that will call the checker concurrently;
+                the connection pool is sized to at least this (default: 1)
         """
-        self.session = requests.Session()
+        self.session = None
+        self._proxy_headers = {}
+        if use_cache:
+            # Responses rarely change between runs minutes apart; the cache also
+            # honors Cache-Control and revalidates stale entries via ETag. POST
+            # covers GraphQL queries, whose body is part of the cache key.
+            try:
+                self.session = requests_cache.CachedSession(
+                    cache_name=CACHE_PATH,
+                    backend='sqlite',
+                    expire_after=CACHE_EXPIRE_AFTER,
+                    allowable_codes=(200, 404),
+                    urls_expire_after={GITHUB_GRAPHQL_URL: CACHE_EXPIRE_AFTER},
+                    allowable_methods=('GET', 'HEAD', 'POST'),
+                    cache_control=True,
+                    filter_fn=_is_cacheable_response,
+                )
+            except (OSError, sqlite3.Error):
+                # Unwritable or broken cache location; carry on without caching
+                pass
+            else:
+                # The Go proxy marks @latest answers fresh for only a short time; let
+                # cached ones serve for the full cache period before revalidating
+                self._proxy_headers = {'Cache-Control': f'max-stale={CACHE_EXPIRE_AFTER}'}
+        if self.session is None:
+            self.session = requests.Session()
+
+        # All requests go to a handful of hosts (api.github.com, proxy.golang.org),
+        # so keep their connections warm and retry transient failures. 429 is
+        # left to _github_request, which rotates to another token instead.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=['GET'],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(POOL_MAXSIZE, max_workers),
+            max_retries=retry,
+        )
+        self.session.mount('https://', adapter)
+
         self.session.headers.update({
             'User-Agent': 'go-mod-checker/0.1.0'
         })
         self.timeout = timeout
 
-        # Add GitHub token authentication if available
-        github_token = os.environ.get('GITHUB_TOKEN')
-        if github_token:
-            self.session.headers.update({
-                'Authorization': f'token {github_token}'
-            })
-
-    def check_module(self, module: Module) -> ModuleCheckResult:
+        # GitHub token authentication if available; GITHUB_TOKENS takes a
+        # comma-separated list that is rotated across requests
+        github_tokens = os.environ.get('GITHUB_TOKENS') or os.environ.get('GITHUB_TOKEN') or ''
+        self._tokens = _TokenPool([t.strip() for t in github_tokens.split(',') if t.strip()])
+
+        # In-process memoization: submodules and major versions of one repository
+        # (github.com/foo/bar, github.com/foo/bar/v2) share the same metadata
+        self._repo_cache: Dict[Tuple[str, str], Optional[dict]] = {}
+        self._version_cache: Dict[str, Optional[str]] = {}
+        self._contributor_cache: Dict[Tuple[str, str], Optional[int]] = {}
+        # Cleared once a GraphQL query fails (e.g. a bad token returning 401),
+        # after which repository lookups go straight to REST
+        self._graphql_ok = True
+
+    def check_module(self, module: Module, deep: bool = True) -> ModuleCheckResult:
         """
         Check if a module is archived, outdated, or OK.
 
+        Args:
+            module: Module to check
+            deep: Also collect warnings (contributor count, staleness) for
+                GitHub modules; False skips the extra contributors request
+
         Returns:
             ModuleCheckResult with status, latest_version, and additional info
         """
         # Check if module is on GitHub by validating the full path structure
-        # Go module paths on GitHub always have the format: github.com/owner/repo[/subpath]
-        parts = module.name.split('/')
-        if len(parts) >= 3 and parts[0] == 'github.com':
-            return self._check_github_module(module)
+        if _github_repo(module.name):
+            return self._check_github_module(module, deep)
         else:
             # For non-GitHub modules, use Go proxy
             return self._check_proxy_module(module)
 
+    def _github_request(self, send: Callable[..., requests.Response], url: str, **kwargs) -> requests.Response:
+        """
+        Send a GitHub API request authenticated with the next pooled token.
+
+        A response reporting an exhausted rate limit puts its token on cool-down
+        until the reset time and the request is retried with the next token.
+        Once only cooling tokens remain, the rate-limited response is returned
+        instead of cycling through them.
+
+        Args:
+            send: Session method to call, e.g. self.session.get
+            url: Request URL
+        """
+        for attempt in range(max(len(self._tokens), 1)):
+            token, cooling = self._tokens.next()
+            if attempt and cooling:
+                break
+            headers = {'Accept': 'application/vnd.github+json'}
+            if token:
+                headers['Authorization'] = f'token {token}'
+            response = send(url, headers=headers, timeout=self.timeout, **kwargs)
+
+            rate_limited = (
+                response.status_code in (403, 429)
+                and response.headers.get('X-RateLimit-Remaining') == '0'
+            )
+            if not (token and rate_limited):
+                break
+            self._tokens.cool_down(token, _rate_limit_reset(response))
+
+        return response
+
+    def prefetch_repos(self, modules: List[Module], executor: Executor, deep: bool = True) -> None:
+        """
+        Fetch repository-level data once per GitHub repository before checking modules.
+
+        Modules such as github.com/foo/bar, github.com/foo/bar/v2 and
+        github.com/foo/bar/subpkg share one repository; concurrent per-module
+        checks would otherwise each fetch it. After this, check_module only
+        needs the per-module latest version lookup.
+
+        Args:
+            modules: Modules about to be checked
+            executor: Executor used to fetch distinct repositories concurrently
+            deep: Also fetch contributor counts (see check_module)
+        """
+        # Distinct repositories in first-seen order
+        repos = list(dict.fromkeys(filter(None, (_github_repo(m.name) for m in modules))))
+
+        # Repository info and contributor counts are independent requests, so
+        # issue them concurrently rather than one after the other per repository
+        futures = []
+        if deep:
+            futures += [executor.submit(self._get_contributor_count, *key) for key in repos]
+        # The GraphQL batch runs here while contributor requests are in flight
+        self.batch_prefetch_github(modules)
+        futures += [executor.submit(self._fetch_repo, *key) for key in repos]
+
+        for future in futures:
+            future.result()
+
+    def batch_prefetch_github(self, modules: List[Module]) -> None:
+        """
+        Prefetch metadata for all GitHub-hosted modules via the GraphQL API.
+
+        One aliased GraphQL query covers up to GRAPHQL_BATCH_SIZE repositories,
+        replacing one REST call per repository. GitHub's GraphQL API requires
+        authentication, so this is a no-op without a token; repositories that
+        are not prefetched fall back to REST in _fetch_repo.
+        """
+        if not (self._tokens and self._graphql_ok):
+            return
+
+        repos = []
+        for module in modules:
+            key = _github_repo(module.name)
+            if key and key not in self._repo_cache and key not in repos:
+                repos.append(key)
+
+        for i in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+            if not self._graphql_ok:
+                break
+            self._query_repos(repos[i:i + GRAPHQL_BATCH_SIZE])
+
+    def _query_repos(self, repos: List[Tuple[str, str]]) -> None:
+        """
+        Fetch archived/updated_at for several repositories in one GraphQL query.
+
+        A failed query leaves the cache untouched and disables GraphQL for the
+        rest of the run, so _fetch_repo falls back to REST without retrying it.
+        """
+        # json.dumps produces valid GraphQL string literals for owner/name
+        fields = ' '.join(
+            f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) '
+            '{ isArchived updatedAt }'
+            for i, (owner, repo) in enumerate(repos)
+        )
+        payload = {}
+        try:
+            response = self._github_request(
+                self.session.post,
+                GITHUB_GRAPHQL_URL,
+                json={'query': f'query {{ {fields} }}'},
+            )
+            if response.status_code == 200:
+                payload = _json_loads(response.content)
+        except (requests.RequestException, ValueError):
+            pass  # Treated as a failed query below
+
+        # GraphQL reports errors such as RATE_LIMITED with HTTP 200 and null data
+        data = payload.get('data') if isinstance(payload, dict) else None
+        if not data:
+            self._graphql_ok = False
+            return
+
+        not_found = _graphql_not_found_aliases(payload)
+        for i, key in enumerate(repos):
+            alias = f'r{i}'
+            node = data.get(alias)
+            if node is None:
+                # Only a NOT_FOUND error means the repository doesn't exist, like a
+                # REST 404; other nulls are left uncached so _fetch_repo uses REST
+                if alias in not_found:
+                    self._repo_cache[key] = None
+                continue
+            self._repo_cache[key] = {
+                'archived': node.get('isArchived', False),
+                'updated_at': node.get('updatedAt'),
+            }
+
+    def _is_module_outdated(self, module: Module, latest: str) -> bool:
+        """Like _is_version_outdated, reusing the module's pre-parsed version key."""
+        latest_key = _semver_key(latest)
+        if module.version_key is not None and latest_key is not None:
+            return latest_key > module.version_key
+        return self._is_version_outdated(module.version, latest)
+
     def _is_version_outdated(self, current: str, latest: str) -> bool:
         """
         Compare two version strings to determine if current is outdated.
@@ -134,6 +490,12 @@ class ModuleChecker:
         Handles semantic versioning properly, including versions with 'v' prefix.
         Returns True if latest is newer than current.
         """
+        # Fast path: Go module versions are almost always strict semver
+        current_key = _semver_key(current)
+        latest_key = _semver_key(latest)
+        if current_key is not None and latest_key is not None:
+            return latest_key > current_key
+
         try:
             # Remove 'v' prefix if present for comparison
             current_clean = current.lstrip('v')
@@ -147,107 +509,157 @@ class ModuleChecker:
             # Fall back to string comparison if version parsing fails
             return latest != current
 
-    def _check_github_module(self, module: Module) -> ModuleCheckResult:
+    def _check_github_module(self, module: Module, deep: bool = True) -> ModuleCheckResult:
         """Check GitHub-hosted module status."""
-        # Extract owner and repo from module name
-        parts = module.name.split('/')
-
-        owner = parts[1]
-        repo = parts[2]
+        owner, repo = _github_repo(module.name)
 
         result = ModuleCheckResult(status='OK', latest_version=None)
 
-        # Get repository information
+        repo_info = self._fetch_repo(owner, repo)
+        if repo_info is not None:
+            if repo_info['archived']:
+                result.status = 'ARCHIVED'
+                return result
+
+            # Store last updated date
+            result.last_updated = repo_info['updated_at']
+
+            # Check if last update was more than 6 months ago
+            if deep and result.last_updated:
+                try:
+                    updated_date = datetime.fromisoformat(result.last_updated.replace('Z', '+00:00'))
+                    six_months_ago = datetime.now(updated_date.tzinfo) - timedelta(days=180)
+                    if updated_date < six_months_ago:
+                        result.warnings.append("Repository not updated in >6 months")
+                except (ValueError, TypeError):
+                    pass  # Invalid date format, skip warning
+
+        # Get contributor count
+        if deep:
+            result.contributor_count = self._get_contributor_count(owner, repo)
+            if result.contributor_count is not None and result.contributor_count < 3:
+                result.warnings.append(f"Repository has only {result.contributor_count} contributor(s)")
+
+        # Check for latest version
+        latest_version = self._get_latest_version(module.name)
+        if latest_version and self._is_module_outdated(module, latest_version):
+            result.status = 'OUTDATED'
+            result.latest_version = latest_version
+
+        return result
+
+    def _fetch_repo(self, owner: str, repo: str) -> Optional[dict]:
+        """
+        Get the archived flag and last update time of a GitHub repository.
+
+        Results are cached per (owner, repo) for the lifetime of the checker.
+        With a token, a GraphQL query selecting just those two fields is used
+        instead of the full REST repository payload.
+
+        Returns:
+            Dict with 'archived' and 'updated_at' keys, or None if unavailable
+        """
+        key = (owner, repo)
+        if key in self._repo_cache:
+            return self._repo_cache[key]
+
+        if self._tokens and self._graphql_ok:
+            self._query_repos([key])
+            if key in self._repo_cache:
+                return self._repo_cache[key]
+            # GraphQL query failed; fall back to REST
+
+        repo_info = None
         api_url = f"https://api.github.com/repos/{owner}/{repo}"
         try:
-            response = self.session.get(api_url, timeout=self.timeout)
+            response = self._github_request(self.session.get, api_url)
             if response.status_code == 200:
                 content_type = response.headers.get('content-type', '')
                 if 'application/json' in content_type:
                     try:
-                        data = response.json()
-                        if data.get('archived', False):
-                            result.status = 'ARCHIVED'
-                            return result
-
-                        # Store last updated date
-                        result.last_updated = data.get('updated_at')
-
-                        # Check if last update was more than 6 months ago
-                        if result.last_updated:
-                            try:
-                                updated_date = datetime.fromisoformat(result.last_updated.replace('Z', '+00:00'))
-                                six_months_ago = datetime.now(updated_date.tzinfo) - timedelta(days=180)
-                                if updated_date < six_months_ago:
-                                    result.warnings.append("Repository not updated in >6 months")
-                            except (ValueError, TypeError):
-                                pass  # Invalid date format, skip warning
-
+                        data = _json_loads(response.content)
+                        repo_info = {
+                            'archived': data.get('archived', False),
+                            'updated_at': data.get('updated_at'),
+                        }
                     except ValueError:
-                        # Invalid JSON, continue to version check
-                        pass
+                        pass  # Invalid JSON
             # Note: 404 means repository not found, not necessarily archived
             # We skip the archived check and proceed to version checking
         except requests.RequestException:
             # If we can't check, assume OK
             pass
 
-        # Get contributor count
-        contributors_url = f"https://api.github.com/repos/{owner}/{repo}/contributors?per_page=100"
-        try:
-            response = self.session.get(contributors_url, timeout=self.timeout)
-            if response.status_code == 200:
-                data = response.json()
-                contributor_count = len(data)
+        self._repo_cache[key] = repo_info
+        return repo_info
 
-                # Check if there are more pages (GitHub limits to 500 contributors)
-                link_header = response.headers.get('Link', '')
-                if 'rel="next"' in link_header:
-                    # There are more contributors, set to a high number to indicate many contributors
-                    contributor_count = 500  # GitHub's max
+    def _get_contributor_count(self, owner: str, repo: str) -> Optional[int]:
+        """Get the contributor count of a GitHub repository, cached per repository."""
+        key = (owner, repo)
+        if key in self._contributor_cache:
+            return self._contributor_cache[key]
 
-                result.contributor_count = contributor_count
+        contributor_count = self._fetch_contributor_count(owner, repo)
+        self._contributor_cache[key] = contributor_count
+        return contributor_count
 
-                # Check if less than 3 contributors
-                if result.contributor_count < 3:
-                    result.warnings.append(f"Repository has only {result.contributor_count} contributor(s)")
+    def _fetch_contributor_count(self, owner: str, repo: str) -> Optional[int]:
+        """
+        Fetch the number of contributors of a GitHub repository.
 
-        except requests.RequestException:
+        Requests a single contributor per page so the total can be read from the
+        page number of the `rel="last"` link instead of downloading the full list.
+
+        Returns:
+            Contributor count, or None if it could not be determined
+        """
+        contributors_url = f"https://api.github.com/repos/{owner}/{repo}/contributors?per_page=1&anon=true"
+        try:
+            response = self._github_request(self.session.get, contributors_url)
+            if response.status_code == 200:
+                match = _LAST_PAGE_RE.search(response.headers.get('Link', ''))
+                if match:
+                    return int(match.group(1))
+                # At most one page: count the (zero or one) entries returned
+                return len(_json_loads(response.content))
+        except (requests.RequestException, ValueError):
             # If we can't check contributors, skip this warning
             pass
 
-        # Check for latest version
-        latest_version = self._get_latest_version(module.name)
-        if latest_version and self._is_version_outdated(module.version, latest_version):
-            result.status = 'OUTDATED'
-            result.latest_version = latest_version
-
-        return result
+        return None
 
     def _check_proxy_module(self, module: Module) -> ModuleCheckResult:
         """Check module status using Go proxy."""
         result = ModuleCheckResult(status='OK', latest_version=None)
         latest_version = self._get_latest_version(module.name)
-        if latest_version and self._is_version_outdated(module.version, latest_version):
+        if latest_version and self._is_module_outdated(module, latest_version):
             result.status = 'OUTDATED'
             result.latest_version = latest_version
 
         return result
 
     def _get_latest_version(self, module_name: str) -> Optional[str]:
-        """Get the latest version of a module from Go proxy."""
+        """Get the latest version of a module from Go proxy, cached per module."""
+        if module_name in self._version_cache:
+            return self._version_cache[module_name]
+
+        latest_version = self._fetch_latest_version(module_name)
+        self._version_cache[module_name] = latest_version
+        return latest_version
+
+    def _fetch_latest_version(self, module_name: str) -> Optional[str]:
+        """Fetch the latest version of a module from Go proxy."""
         # Use Go proxy to get latest version
         proxy_url = f"https://proxy.golang.org/{module_name}/@latest"
         try:
-            response = self.session.get(proxy_url, timeout=self.timeout)
+            response = self.session.get(proxy_url, headers=self._proxy_headers, timeout=self.timeout)
             if response.status_code == 200:
                 content_type = response.headers.get('content-type', '')
                 if 'application/json' in content_type:
-                    try:
-                        data = response.json()
-                        return data.get('Version')
-                    except ValueError:
-                        pass  # Invalid JSON
+                    # Only the Version field is needed, so skip decoding the whole object
+                    match = _PROXY_VERSION_RE.search(response.content)
+                    if match:
+                        return match.group(1).decode('utf-8')
         except requests.RequestException:
             # Network error or invalid response; unable to fetch latest version, so return None.
             pass
@@ -1,17 +1,37 @@
 """Command-line interface for go-mod-checker."""
 
+import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from colorama import init, Fore, Style
 
 from .checker import GoModParser, ModuleChecker
 
 
+# Default number of modules checked concurrently; kept modest to stay
+# friendly with GitHub's secondary rate limits
+MAX_WORKERS = 20
+
+# Colored status labels, built once instead of per printed module
+_STATUS_TEXT = {
+    'ARCHIVED': f"{Fore.RED}ARCHIVED{Style.RESET_ALL}",
+    'OUTDATED': f"{Fore.YELLOW}OUTDATED{Style.RESET_ALL}",
+    'OK': f"{Fore.GREEN}OK{Style.RESET_ALL}",
+}
+
+
 def main():
     """Main entry point for the CLI."""
-    # Initialize colorama for cross-platform colored output
-    init(autoreset=True)
+    if os.environ.get('NO_COLOR') or not sys.stdout.isatty():
+        # Strip color codes from piped/redirected output, and honor the
+        # NO_COLOR convention (https://no-color.org)
+        init(strip=True)
+    else:
+        # Initialize colorama for cross-platform colored output
+        init(autoreset=True)
 
     parser = argparse.ArgumentParser(
         description='Check Go module dependencies status',
@@ -23,6 +43,22 @@ def main():
         default='go.mod',
         help='Path to go.mod file (default: go.mod in current directory)'
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=MAX_WORKERS,
+        help=f'Number of modules to check concurrently (default: {MAX_WORKERS})'
+    )
+    parser.add_argument(
+        '--no-warnings',
+        action='store_true',
+        help='Skip contributor and staleness warnings for GitHub modules (fewer API calls)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not use or update the on-disk HTTP response cache'
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -30,6 +66,8 @@ def main():
     )
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
 
     # Check if go.mod file exists
     go_mod_path = Path(args.path)
@@ -52,7 +90,7 @@ def main():
         sys.exit(0)
 
     # Check each module
-    checker = ModuleChecker()
+    checker = ModuleChecker(use_cache=not args.no_cache, max_workers=args.jobs)
 
     print(f"Found {len(modules)} direct dependencies:\n")
 
@@ -60,17 +98,23 @@ def main():
     outdated_count = 0
     ok_count = 0
 
-    for module in modules:
-        result = checker.check_module(module)
+    deep = not args.no_warnings
+
+    # Checks are I/O-bound, so run them concurrently; map() keeps input order.
+    # Repository-level data is fetched once per repository first, so modules
+    # sharing a repository don't repeat those requests.
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        checker.prefetch_repos(modules, executor, deep=deep)
+        results = list(executor.map(partial(checker.check_module, deep=deep), modules))
 
+    for module, result in zip(modules, results):
+        status_text = _STATUS_TEXT[result.status]
         if result.status == 'ARCHIVED':
-            status_text = f"{Fore.RED}ARCHIVED{Style.RESET_ALL}"
             archived_count += 1
         elif result.status == 'OUTDATED':
-            status_text = f"{Fore.YELLOW}OUTDATED{Style.RESET_ALL} (latest: {result.latest_version})"
+            status_text += f" (latest: {result.latest_version})"
             outdated_count += 1
         else:  # OK
-            status_text = f"{Fore.GREEN}OK{Style.RESET_ALL}"
             ok_count += 1
 
         print(f"  {module.name} {module.version} - {status_text}")
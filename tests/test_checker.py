@@ -0,0 +1,484 @@
+"""Tests for ModuleChecker."""
+
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+import requests_cache.models.response
+import requests_cache.policy.actions
+import urllib3
+from requests.adapters import BaseAdapter
+from urllib3.connectionpool import HTTPConnectionPool
+
+from go_mod_checker.checker import Module, ModuleChecker
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, json_data=None, headers=None):
+        self.status_code = status_code
+        self._json_data = json_data
+        self.headers = {'content-type': 'application/json'}
+        self.headers.update(headers or {})
+
+    @property
+    def content(self):
+        return json.dumps(self._json_data).encode('utf-8')
+
+
+def test_repo_metadata_is_fetched_once_per_repository(monkeypatch):
+    """Test that modules sharing a repository reuse its cached metadata."""
+    checker = ModuleChecker(use_cache=False)
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        if url.endswith('/@latest'):
+            return FakeResponse(json_data={'Version': 'v2.0.0'})
+        if '/contributors' in url:
+            return FakeResponse(json_data=[{}, {}, {}])
+        return FakeResponse(json_data={'archived': False, 'updated_at': None})
+
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+
+    checker.check_module(Module('github.com/foo/bar', 'v1.0.0'))
+    checker.check_module(Module('github.com/foo/bar/v2', 'v2.0.0'))
+    checker.check_module(Module('github.com/foo/bar', 'v1.0.0'))
+
+    assert requested.count('https://api.github.com/repos/foo/bar') == 1
+    assert requested.count('https://proxy.golang.org/github.com/foo/bar/@latest') == 1
+
+
+def test_batch_prefetch_github_fills_repo_cache(monkeypatch):
+    """Test that GraphQL prefetch results are used instead of REST calls."""
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+    checker = ModuleChecker(use_cache=False)
+    queries = []
+
+    def fake_post(url, json=None, **kwargs):
+        queries.append(json['query'])
+        return FakeResponse(json_data={
+            'data': {
+                'r0': {'isArchived': True, 'updatedAt': '2020-01-01T00:00:00Z'},
+                'r1': None,
+            },
+            'errors': [{'type': 'NOT_FOUND', 'path': ['r1']}],
+        })
+
+    def fake_get(url, **kwargs):
+        raise AssertionError(f"unexpected GET {url}")
+
+    monkeypatch.setattr(checker.session, 'post', fake_post)
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+
+    checker.batch_prefetch_github([
+        Module('github.com/foo/bar', 'v1.0.0'),
+        Module('github.com/foo/bar/v2', 'v2.0.0'),
+        Module('github.com/gone/repo', 'v1.0.0'),
+        Module('golang.org/x/sync', 'v0.1.0'),
+    ])
+
+    assert len(queries) == 1
+    assert checker.check_module(Module('github.com/foo/bar', 'v1.0.0')).status == 'ARCHIVED'
+    assert checker._repo_cache[('gone', 'repo')] is None
+
+
+def test_contributor_count_read_from_link_header(monkeypatch):
+    """Test that the contributor count comes from the last page link."""
+    checker = ModuleChecker(use_cache=False)
+    link = (
+        '<https://api.github.com/repositories/1/contributors?per_page=1&anon=true&page=2>; rel="next", '
+        '<https://api.github.com/repositories/1/contributors?per_page=1&anon=true&page=42>; rel="last"'
+    )
+    monkeypatch.setattr(
+        checker.session, 'get',
+        lambda url, **kwargs: FakeResponse(json_data=[{}], headers={'Link': link}),
+    )
+
+    assert checker._fetch_contributor_count('foo', 'bar') == 42
+
+
+def test_check_module_without_deep_skips_contributors(monkeypatch):
+    """Test that deep=False checks status without the contributors request."""
+    checker = ModuleChecker(use_cache=False)
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        if url.endswith('/@latest'):
+            return FakeResponse(json_data={'Version': 'v1.0.0'})
+        return FakeResponse(json_data={'archived': False, 'updated_at': '2000-01-01T00:00:00Z'})
+
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+
+    result = checker.check_module(Module('github.com/foo/bar', 'v1.0.0'), deep=False)
+
+    assert result.status == 'OK'
+    assert result.warnings == []
+    assert not any('/contributors' in url for url in requested)
+
+
+@pytest.mark.parametrize('status_code', [403, 429])
+def test_github_tokens_rotate_past_rate_limited_token(monkeypatch, status_code):
+    """Test that a rate-limited token is skipped in favour of the next one."""
+    monkeypatch.setenv('GITHUB_TOKENS', 'first, second')
+    checker = ModuleChecker(use_cache=False)
+    used = []
+
+    def fake_get(url, headers=None, **kwargs):
+        used.append(headers['Authorization'])
+        if headers['Authorization'] == 'token first':
+            return FakeResponse(status_code=status_code, headers={
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset': '9999999999',
+            })
+        return FakeResponse(json_data=[{}])
+
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+
+    assert checker._fetch_contributor_count('foo', 'bar') == 1
+    assert checker._fetch_contributor_count('foo', 'baz') == 1
+    assert used == ['token first', 'token second', 'token second']
+
+
+def test_invalid_rate_limit_reset_header_is_tolerated(monkeypatch):
+    """Test that a malformed X-RateLimit-Reset still cools the token instead of raising."""
+    monkeypatch.setenv('GITHUB_TOKENS', 'first,second')
+    checker = ModuleChecker(use_cache=False)
+
+    def fake_get(url, headers=None, **kwargs):
+        if headers['Authorization'] == 'token first':
+            return FakeResponse(status_code=403, headers={
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset': 'soon',
+            })
+        return FakeResponse(json_data={'archived': False, 'updated_at': None})
+
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+
+    assert checker._github_request(checker.session.get, 'https://api.github.com/repos/foo/bar').status_code == 200
+    assert checker._tokens.next() == ('second', False)
+
+
+def test_exhausted_token_pool_is_not_cycled_on_every_request(monkeypatch):
+    """Test that once all tokens are rate-limited, each request is sent only once."""
+    monkeypatch.setenv('GITHUB_TOKENS', 'first,second,third')
+    checker = ModuleChecker(use_cache=False)
+    sent = []
+
+    def fake_get(url, headers=None, **kwargs):
+        sent.append(headers['Authorization'])
+        return FakeResponse(status_code=403, headers={
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': '9999999999',
+        })
+
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+
+    for _ in range(5):
+        response = checker._github_request(checker.session.get, 'https://api.github.com/repos/foo/bar')
+        assert response.status_code == 403
+
+    assert len(sent) == 3 + 4
+
+
+def test_rate_limited_429_reaches_token_rotation(monkeypatch):
+    """Test that a 429 passes through the session's retrying adapter to token rotation."""
+    monkeypatch.setenv('GITHUB_TOKENS', 'first,second')
+    checker = ModuleChecker(use_cache=False)
+    used = []
+
+    def fake_make_request(self, conn, method, url, **kwargs):
+        token = kwargs['headers'].get('Authorization')
+        used.append(token)
+        if token == 'token first':
+            return urllib3.HTTPResponse(
+                body=io.BytesIO(b''),
+                headers={'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '9999999999'},
+                status=429, preload_content=False, request_method=method, request_url=url,
+            )
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(b'[{}]'),
+            headers={'Content-Type': 'application/json'},
+            status=200, preload_content=False, request_method=method, request_url=url,
+        )
+
+    monkeypatch.setattr(HTTPConnectionPool, '_make_request', fake_make_request)
+
+    assert checker._fetch_contributor_count('foo', 'bar') == 1
+    assert used == ['token first', 'token second']
+
+
+def test_is_version_outdated_semver():
+    """Test semantic version comparison, including prereleases."""
+    checker = ModuleChecker(use_cache=False)
+
+    assert checker._is_version_outdated('v1.8.0', 'v1.8.4')
+    assert checker._is_version_outdated('v1.9.0', 'v1.10.0')
+    assert not checker._is_version_outdated('v1.8.4', 'v1.8.4')
+    assert not checker._is_version_outdated('v2.0.0', 'v1.9.9')
+    assert checker._is_version_outdated('v1.0.0-rc.1', 'v1.0.0')
+    assert not checker._is_version_outdated('v1.0.0', 'v1.0.0-rc.1')
+    assert checker._is_version_outdated('v1.0.0-rc.2', 'v1.0.0-rc.10')
+    assert checker._is_version_outdated(
+        'v0.0.0-20210101000000-abcdefabcdef', 'v0.0.0-20220101000000-abcdefabcdef'
+    )
+    assert not checker._is_version_outdated('v2.0.0+incompatible', 'v2.0.0+incompatible')
+
+
+def test_fetch_repo_with_token_uses_graphql(monkeypatch):
+    """Test that a single repository lookup uses GraphQL when authenticated."""
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+    checker = ModuleChecker(use_cache=False)
+
+    def fake_post(url, json=None, **kwargs):
+        assert 'isArchived updatedAt' in json['query']
+        return FakeResponse(json_data={'data': {'r0': {'isArchived': False, 'updatedAt': None}}})
+
+    def fake_get(url, **kwargs):
+        raise AssertionError(f"unexpected GET {url}")
+
+    monkeypatch.setattr(checker.session, 'post', fake_post)
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+
+    assert checker._fetch_repo('foo', 'bar') == {'archived': False, 'updated_at': None}
+
+
+def test_prefetch_repos_fetches_each_repository_once(monkeypatch):
+    """Test that modules sharing a repository trigger one set of repository requests."""
+    checker = ModuleChecker(use_cache=False, max_workers=4)
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        if url.endswith('/@latest'):
+            return FakeResponse(json_data={'Version': 'v1.0.0'})
+        if '/contributors' in url:
+            return FakeResponse(json_data=[{}])
+        return FakeResponse(json_data={'archived': False, 'updated_at': None})
+
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+    modules = [
+        Module('github.com/foo/bar', 'v1.0.0'),
+        Module('github.com/foo/bar/v2', 'v2.0.0'),
+        Module('github.com/foo/bar/subpkg', 'v1.0.0'),
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        checker.prefetch_repos(modules, executor)
+        results = list(executor.map(checker.check_module, modules))
+
+    assert requested.count('https://api.github.com/repos/foo/bar') == 1
+    assert sum('/contributors' in url for url in requested) == 1
+    assert all(result.contributor_count == 1 for result in results)
+
+
+def test_is_module_outdated_uses_parsed_version():
+    """Test outdated checks against a module's pre-parsed version."""
+    checker = ModuleChecker(use_cache=False)
+    module = Module('github.com/foo/bar', 'v1.2.3')
+
+    assert module.version_key == (1, 2, 3, 1, ())
+    assert checker._is_module_outdated(module, 'v1.3.0')
+    assert not checker._is_module_outdated(module, 'v1.2.3')
+    assert checker._is_module_outdated(Module('example.com/x', 'latest'), 'v1.0.0')
+
+
+def test_fetch_latest_version_reads_version_from_raw_body(monkeypatch):
+    """Test that the Version field is extracted from the proxy's @latest body."""
+    checker = ModuleChecker(use_cache=False)
+
+    def serve(payload):
+        monkeypatch.setattr(checker.session, 'get', lambda url, **kwargs: FakeResponse(json_data=payload))
+
+    serve({'Version': 'v1.2.3', 'Time': '2024-01-01T00:00:00Z'})
+    assert checker._fetch_latest_version('github.com/foo/bar') == 'v1.2.3'
+
+    serve({'Time': '2024-01-01T00:00:00Z'})
+    assert checker._fetch_latest_version('github.com/foo/bar') is None
+
+
+class StubAdapter(BaseAdapter):
+    """Transport adapter answering every request with a fixed JSON payload."""
+
+    def __init__(self, payload, headers=None):
+        super().__init__()
+        self.payload = payload
+        self.headers = {'Content-Type': 'application/json'}
+        self.headers.update(headers or {})
+        self.requests = []
+
+    @property
+    def sent(self):
+        return len(self.requests)
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        body = json.dumps(self.payload).encode('utf-8')
+        response = requests.Response()
+        response.status_code = 200
+        response.headers.update(self.headers)
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(body), headers=self.headers, status=200,
+            preload_content=False, request_url=request.url,
+        )
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def advance_cache_clock(monkeypatch, seconds):
+    """Move requests-cache's notion of 'now' forward by the given number of seconds."""
+    now = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    monkeypatch.setattr(requests_cache.policy.actions, 'utcnow', lambda: now)
+    monkeypatch.setattr(requests_cache.models.response, 'utcnow', lambda: now)
+
+
+def test_graphql_queries_are_cached_on_disk(monkeypatch, tmp_path):
+    """Test that a repeated GraphQL query is answered from the on-disk cache."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+    adapter = StubAdapter({'data': {'r0': {'isArchived': True, 'updatedAt': None}}})
+
+    for _ in range(2):
+        checker = ModuleChecker()
+        checker.session.mount('https://', adapter)
+        assert checker._fetch_repo('foo', 'bar') == {'archived': True, 'updated_at': None}
+        checker.session.close()
+
+    assert adapter.sent == 1
+
+
+def test_failed_graphql_query_falls_back_to_rest_for_the_run(monkeypatch):
+    """Test that after a failed GraphQL query, repository lookups go straight to REST."""
+    monkeypatch.setenv('GITHUB_TOKEN', 'bad-token')
+    checker = ModuleChecker(use_cache=False)
+    posts = []
+    gets = []
+
+    def fake_post(url, **kwargs):
+        posts.append(url)
+        return FakeResponse(status_code=401, json_data={'message': 'Bad credentials'})
+
+    def fake_get(url, **kwargs):
+        gets.append(url)
+        return FakeResponse(json_data={'archived': False, 'updated_at': None})
+
+    monkeypatch.setattr(checker.session, 'post', fake_post)
+    monkeypatch.setattr(checker.session, 'get', fake_get)
+
+    checker.batch_prefetch_github([Module('github.com/foo/bar', 'v1.0.0')])
+    assert checker._fetch_repo('foo', 'bar') == {'archived': False, 'updated_at': None}
+    assert checker._fetch_repo('foo', 'baz') == {'archived': False, 'updated_at': None}
+
+    assert len(posts) == 1
+    assert gets == ['https://api.github.com/repos/foo/bar', 'https://api.github.com/repos/foo/baz']
+
+
+def test_failed_graphql_answers_are_not_cached(monkeypatch, tmp_path):
+    """Test that GraphQL errors reported with HTTP 200 are not replayed from the cache."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+    adapter = StubAdapter({'data': None, 'errors': [{'type': 'RATE_LIMITED'}]})
+
+    for _ in range(2):
+        checker = ModuleChecker()
+        checker.session.mount('https://', adapter)
+        checker.batch_prefetch_github([Module('github.com/foo/bar', 'v1.0.0')])
+        assert not checker._graphql_ok
+        checker.session.close()
+
+    assert adapter.sent == 2
+
+
+def test_graphql_null_node_without_not_found_is_not_cached(monkeypatch):
+    """Test that a null node caused by a transient error is not cached as 'not found'."""
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+    checker = ModuleChecker(use_cache=False)
+    monkeypatch.setattr(
+        checker.session, 'post',
+        lambda url, **kwargs: FakeResponse(json_data={
+            'data': {'r0': None, 'r1': None},
+            'errors': [
+                {'type': 'SERVICE_UNAVAILABLE', 'path': ['r0']},
+                {'type': 'NOT_FOUND', 'path': ['r1']},
+            ],
+        }),
+    )
+
+    checker.batch_prefetch_github([
+        Module('github.com/flaky/repo', 'v1.0.0'),
+        Module('github.com/gone/repo', 'v1.0.0'),
+    ])
+
+    assert ('flaky', 'repo') not in checker._repo_cache
+    assert checker._repo_cache[('gone', 'repo')] is None
+
+
+def test_graphql_answers_expire_after_the_cache_period(monkeypatch, tmp_path):
+    """Test that a cached GraphQL answer is served within the hour and refetched after it."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+    adapter = StubAdapter({'data': {'r0': {'isArchived': True, 'updatedAt': None}}})
+
+    def fetch():
+        checker = ModuleChecker()
+        checker.session.mount('https://', adapter)
+        checker._fetch_repo('foo', 'bar')
+        checker.session.close()
+
+    fetch()
+    assert 'max-stale' not in adapter.requests[0].headers.get('Cache-Control', '')
+
+    advance_cache_clock(monkeypatch, 30 * 60)
+    fetch()
+    assert adapter.sent == 1
+
+    advance_cache_clock(monkeypatch, 61 * 60)
+    fetch()
+    assert adapter.sent == 2
+
+
+def test_unusable_cache_directory_falls_back_to_uncached_session(monkeypatch, tmp_path):
+    """Test that a cache location that cannot be created does not stop the checker."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    (tmp_path / '.cache').write_text('not a directory')
+
+    checker = ModuleChecker()
+
+    assert not isinstance(checker.session, requests_cache.CachedSession)
+    assert checker._proxy_headers == {}
+
+
+def test_expired_proxy_answer_is_reused_within_the_cache_period(monkeypatch, tmp_path):
+    """Test that a Go proxy answer past its short max-age is still served from cache."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    adapter = StubAdapter(
+        {'Version': 'v1.2.3', 'Time': '2024-01-01T00:00:00Z'},
+        headers={'Cache-Control': 'public, max-age=1'},
+    )
+
+    def fetch():
+        checker = ModuleChecker()
+        checker.session.mount('https://', adapter)
+        latest = checker._fetch_latest_version('github.com/foo/bar')
+        checker.session.close()
+        return latest
+
+    assert fetch() == 'v1.2.3'
+
+    advance_cache_clock(monkeypatch, 30 * 60)
+    assert fetch() == 'v1.2.3'
+    assert adapter.sent == 1
+
+    advance_cache_clock(monkeypatch, 2 * 60 * 60)
+    assert fetch() == 'v1.2.3'
+    assert adapter.sent == 2
@@ -0,0 +1,21 @@
+"""Tests for the go-mod-checker command-line interface."""
+
+import subprocess
+import sys
+
+
+def test_piped_output_has_no_color_codes(tmp_path):
+    """Test that output written to a pipe contains no ANSI escape codes."""
+    test_file = tmp_path / "go.mod"
+    test_file.write_text("module example.com/test\n\ngo 1.21\n")
+
+    result = subprocess.run(
+        [sys.executable, '-m', 'go_mod_checker.cli', str(test_file)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+
+    assert result.returncode == 0
+    assert b'No direct dependencies found in go.mod' in result.stdout
+    assert b'\x1b[' not in result.stdout
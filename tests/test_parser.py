@@ -1,5 +1,9 @@
 """Tests for go-mod-checker."""
 
+import os
+import sys
+import threading
+
 import pytest
 
 from go_mod_checker.checker import GoModParser
@@ -91,3 +95,94 @@ go 1.21
     modules = parser.parse()
     
     assert len(modules) == 0
+
+
+def test_parser_with_mixed_require_directives(tmp_path):
+    """Test parsing multiple require blocks, single-line requires and comments."""
+    content = """module example.com/test
+
+go 1.21
+
+// require github.com/commented/out v1.0.0
+
+require (
+    github.com/gin-gonic/gin v1.9.0
+    // github.com/commented/line v1.0.0
+    github.com/stretchr/testify v1.8.0 // test only
+)
+
+require github.com/gorilla/mux v1.8.0
+
+require (
+    golang.org/x/sync v0.1.0
+    github.com/indirect/dep v1.0.0 // indirect
+)
+"""
+    test_file = tmp_path / "go.mod"
+    test_file.write_text(content)
+
+    parser = GoModParser(str(test_file))
+    modules = parser.parse()
+
+    assert [m.name for m in modules] == [
+        'github.com/gin-gonic/gin',
+        'github.com/stretchr/testify',
+        'github.com/gorilla/mux',
+        'golang.org/x/sync',
+    ]
+
+
+def test_parser_empty_file(tmp_path):
+    """Test parsing an empty go.mod file."""
+    test_file = tmp_path / "go.mod"
+    test_file.write_text("")
+
+    parser = GoModParser(str(test_file))
+
+    assert parser.parse() == []
+
+
+def test_parser_finds_require_after_replace_directives(tmp_path):
+    """Test that require directives after a block and replace section are parsed."""
+    content = """module example.com/test
+
+go 1.21
+
+require (
+    github.com/gin-gonic/gin v1.9.0
+)
+
+replace (
+    github.com/gin-gonic/gin => ../gin
+    github.com/old/mod v1.0.0 => github.com/new/mod v1.1.0
+)
+
+retract v1.0.0
+
+require github.com/gorilla/mux v1.8.0
+"""
+    test_file = tmp_path / "go.mod"
+    test_file.write_text(content)
+
+    parser = GoModParser(str(test_file))
+    modules = parser.parse()
+
+    assert [m.name for m in modules] == ['github.com/gin-gonic/gin', 'github.com/gorilla/mux']
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="requires os.mkfifo")
+def test_parser_reads_from_fifo(tmp_path):
+    """Test parsing from a pipe such as <(cat go.mod), which reports a size of 0."""
+    fifo = tmp_path / "go.mod"
+    os.mkfifo(fifo)
+
+    def write_content():
+        with open(fifo, 'w') as f:
+            f.write("module example.com/test\n\nrequire github.com/gorilla/mux v1.8.0\n")
+
+    writer = threading.Thread(target=write_content)
+    writer.start()
+    modules = GoModParser(str(fifo)).parse()
+    writer.join()
+
+    assert [m.name for m in modules] == ['github.com/gorilla/mux']